@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import pickle
 import random
 import shutil
-from collections import defaultdict
-from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+import sys
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
+from functools import partial
+from itertools import islice
 from types import TracebackType
-from typing import Any
+from typing import Any, TypeVar
 
 from langchain_core.runnables import RunnableConfig
 
@@ -29,6 +41,79 @@ from langgraph.checkpoint.base import (
 
 logger = logging.getLogger(__name__)
 
+# default factories for nested mappings, partials avoid a Python frame per miss
+_dict_of_dicts = partial(defaultdict, dict)
+
+# number of decoded checkpoints kept around by `InMemorySaver`
+_CHECKPOINT_CACHE_SIZE = 256
+# number of checkpoint tuples `InMemorySaver.alist` fetches per worker thread hop
+_ALIST_BATCH_SIZE = 32
+
+T = TypeVar("T")
+
+
+def _intern_channel(channel: str) -> str:
+    """Intern a channel name, so writes to the same channel share one object.
+
+    Only use this for values drawn from a small fixed set, like channel names:
+    interned strings are immortal on Python 3.12, so interning per-step values
+    (eg. task IDs) would leak memory that `delete_thread` can't free.
+    """
+    # sys.intern rejects str subclasses (eg. StrEnum channel names)
+    return sys.intern(channel) if type(channel) is str else channel
+
+
+def _insort_unique(checkpoint_ids: list[str], checkpoint_id: str) -> None:
+    idx = bisect_left(checkpoint_ids, checkpoint_id)
+    if idx == len(checkpoint_ids) or checkpoint_ids[idx] != checkpoint_id:
+        checkpoint_ids.insert(idx, checkpoint_id)
+
+
+class _ThreadKeyIndex:
+    """Keys of a `writes` / `blobs` mapping grouped by thread ID, so deleting a
+    thread doesn't need to scan every other thread's entries."""
+
+    __slots__ = ("by_thread", "count")
+
+    def __init__(self) -> None:
+        self.by_thread: defaultdict[str, set[tuple[Any, ...]]] = defaultdict(set)
+        # total number of indexed keys, kept up to date so it can be checked
+        # against the mapping without summing every thread's keys
+        self.count = 0
+
+    def add(self, key: tuple[Any, ...]) -> None:
+        keys = self.by_thread[key[0]]
+        if key not in keys:
+            keys.add(key)
+            self.count += 1
+
+    def delete_thread(self, thread_id: str, mapping: dict[Any, Any]) -> None:
+        """Remove a thread's entries from `mapping`."""
+        if self.count != len(mapping):
+            # entries were set or removed without going through the saver
+            self.by_thread.clear()
+            for key in list(mapping):
+                self.by_thread[key[0]].add(key)
+            self.count = len(mapping)
+        keys = self.by_thread.pop(thread_id, ())
+        self.count -= len(keys)
+        for key in keys:
+            mapping.pop(key, None)
+
+
+def _copy_stored_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
+    """Copy the mutable parts of a decoded checkpoint, so callers can't alter
+    the cached instance."""
+    copied = checkpoint.copy()
+    copied["channel_versions"] = checkpoint["channel_versions"].copy()
+    if (versions_seen := checkpoint.get("versions_seen")) is not None:
+        copied["versions_seen"] = {k: v.copy() for k, v in versions_seen.items()}
+    if (updated_channels := checkpoint.get("updated_channels")) is not None:
+        copied["updated_channels"] = updated_channels.copy()
+    if (pending_sends := checkpoint.get("pending_sends")) is not None:
+        copied["pending_sends"] = pending_sends.copy()  # type: ignore[typeddict-unknown-key]
+    return copied
+
 
 class InMemorySaver(
     BaseCheckpointSaver[str], AbstractContextManager, AbstractAsyncContextManager
@@ -45,6 +130,10 @@ class InMemorySaver(
 
     Args:
         serde: The serializer to use for serializing and deserializing checkpoints.
+        offload_to_thread: Run the work of the async methods in a worker thread
+            instead of on the event loop. Off by default, as the thread hop costs
+            more than (de)serializing typical checkpoints; turn it on when
+            checkpoints are large enough to stall other coroutines.
 
     Example:
         ```python
@@ -81,17 +170,38 @@ class InMemorySaver(
         ],  # thread id, checkpoint ns, channel, version
         tuple[str, bytes],
     ]
+    # thread ID -> checkpoint NS -> (indexed checkpoint mapping, its checkpoint
+    # IDs in ascending order)
+    _checkpoint_ids: defaultdict[str, dict[str, tuple[dict[str, Any], list[str]]]]
+    # keys into `writes` / `blobs` by thread ID, None when they come from a
+    # custom factory (eg. `PersistentDict`) and can be loaded behind our back
+    _thread_write_keys: _ThreadKeyIndex | None
+    _thread_blob_keys: _ThreadKeyIndex | None
+    # (thread ID, checkpoint NS, checkpoint ID) -> (stored bytes, serde, decoded),
+    # least recently used first
+    _checkpoint_cache: OrderedDict[
+        tuple[str, str, str], tuple[tuple[str, bytes], SerializerProtocol, Checkpoint]
+    ]
 
     def __init__(
         self,
         *,
         serde: SerializerProtocol | None = None,
         factory: type[defaultdict] = defaultdict,
+        offload_to_thread: bool = False,
     ) -> None:
         super().__init__(serde=serde)
-        self.storage = factory(lambda: defaultdict(dict))
+        self.offload_to_thread = offload_to_thread
+        self.storage = factory(_dict_of_dicts)
         self.writes = factory(dict)
         self.blobs = factory()
+        self._checkpoint_ids = defaultdict(dict)
+        if factory is defaultdict:
+            self._thread_write_keys = _ThreadKeyIndex()
+            self._thread_blob_keys = _ThreadKeyIndex()
+        else:
+            self._thread_write_keys = self._thread_blob_keys = None
+        self._checkpoint_cache = OrderedDict()
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
@@ -122,22 +232,105 @@ class InMemorySaver(
     ) -> bool | None:
         return self.stack.__exit__(__exc_type, __exc_value, __traceback)
 
+    async def _run_sync(
+        self, func: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> T:
+        if self.offload_to_thread:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    def _get_checkpoint_ids(self, thread_id: str, checkpoint_ns: str) -> list[str]:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        indexed = self._checkpoint_ids[thread_id].get(checkpoint_ns)
+        # the index is rebuilt when the namespace mapping was replaced (eg. by
+        # loading a `PersistentDict`) or its size or newest ID changed; other
+        # in-place edits to `storage` that bypass `put` aren't detected
+        if (
+            indexed is not None
+            and indexed[0] is checkpoints
+            and len(indexed[1]) == len(checkpoints)
+            and (not indexed[1] or indexed[1][-1] in checkpoints)
+        ):
+            return indexed[1]
+        checkpoint_ids = sorted(checkpoints)
+        self._checkpoint_ids[thread_id][checkpoint_ns] = (checkpoints, checkpoint_ids)
+        return checkpoint_ids
+
+    def _load_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        checkpoint: tuple[str, bytes],
+    ) -> Checkpoint:
+        """Deserialize a stored checkpoint, reusing a recently decoded one.
+
+        The returned checkpoint is shared with the cache and must not be
+        mutated, see `_copy_stored_checkpoint`.
+        """
+        key = (thread_id, checkpoint_ns, checkpoint_id)
+        cache = self._checkpoint_cache
+        cached = cache.pop(key, None)
+        # stale if the checkpoint was overwritten or read through a saver
+        # with a different serializer (eg. `with_allowlist`)
+        if cached is None or cached[0] is not checkpoint or cached[1] is not self.serde:
+            cached = (checkpoint, self.serde, self.serde.loads_typed(checkpoint))
+        cache[key] = cached
+        if len(cache) > _CHECKPOINT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return cached[2]
+
     def _load_blobs(
         self,
         thread_id: str,
         checkpoint_ns: str,
         versions: ChannelVersions,
     ) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        for k, ver in versions.items():
-            kk = (thread_id, checkpoint_ns, k, ver)
-            if kk not in self.blobs:
-                continue
-            vv = self.blobs[kk]
-            if vv[0] == "empty":
-                continue
-            result[k] = self.serde.loads_typed(vv)
-        return result
+        blobs = self.blobs
+        loads_typed = self.serde.loads_typed
+        return {
+            k: loads_typed(vv)
+            for k, ver in versions.items()
+            if (vv := blobs.get((thread_id, checkpoint_ns, k, ver))) is not None
+            and vv[0] != "empty"
+        }
+
+    def _load_writes(
+        self, thread_id: str, checkpoint_ns: str, checkpoint_id: str
+    ) -> list[PendingWrite]:
+        writes = self.writes.get((thread_id, checkpoint_ns, checkpoint_id))
+        if not writes:
+            return []
+        loads_typed = self.serde.loads_typed
+        return [(task_id, c, loads_typed(v)) for task_id, c, v, _ in writes.values()]
+
+    def _dump_checkpoint(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+        blobs: dict[tuple[str, str, str, str | int | float], tuple[str, bytes]],
+    ) -> tuple[tuple[str, bytes], tuple[str, bytes], str | None]:
+        """Serialize a checkpoint's new channel values into `blobs` and return
+        its storage entry."""
+        c = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+        blob_keys = self._thread_blob_keys
+        for k, v in new_versions.items():
+            blob_key = (thread_id, checkpoint_ns, k, v)
+            blobs[blob_key] = (
+                self.serde.dumps_typed(values[k]) if k in values else ("empty", b"")
+            )
+            if blob_keys is not None:
+                blob_keys.add(blob_key)
+        return (
+            self.serde.dumps_typed(c),
+            self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+            config["configurable"].get("checkpoint_id"),  # parent
+        )
 
     def get_delta_channel_history(
         self, *, config: RunnableConfig, channels: Sequence[str]
@@ -164,40 +357,31 @@ class InMemorySaver(
         checkpoint_id = config["configurable"].get("checkpoint_id", "")
         ns_storage = self.storage.get(thread_id, {}).get(checkpoint_ns, {})
 
-        chain: list[str] = []
-        target_entry = ns_storage.get(checkpoint_id)
-        current: str | None = target_entry[2] if target_entry is not None else None
-        while current is not None:
-            entry = ns_storage.get(current)
-            if entry is None:
-                break
-            chain.append(current)
-            _, _, parent = entry
-            current = parent
-
         collected_by_ch: dict[str, list[PendingWrite]] = {c: [] for c in channels}
         seed_by_ch: dict[str, Any] = {}
         remaining: set[str] = set(channels)
 
-        for cp_id in chain:
-            if not remaining:
-                break
+        # walk ancestors lazily, stopping as soon as every channel terminated
+        target_entry = ns_storage.get(checkpoint_id)
+        cp_id: str | None = target_entry[2] if target_entry is not None else None
+        while cp_id is not None and remaining:
             entry = ns_storage.get(cp_id)
-            ckpt = self.serde.loads_typed(entry[0]) if entry is not None else None
+            if entry is None:
+                break
+            ckpt = self._load_checkpoint(thread_id, checkpoint_ns, cp_id, entry[0])
 
             terminated_here: set[str] = set()
             blob_value_by_ch: dict[str, Any] = {}
-            if ckpt is not None:
-                versions = ckpt.get("channel_versions", {})
-                for ch in remaining:
-                    ver = versions.get(ch)
-                    if ver is None:
-                        continue
-                    blob_entry = self.blobs.get((thread_id, checkpoint_ns, ch, ver))
-                    if blob_entry is None or blob_entry[0] == "empty":
-                        continue
-                    blob_value_by_ch[ch] = self.serde.loads_typed(blob_entry)
-                    terminated_here.add(ch)
+            versions = ckpt.get("channel_versions", {})
+            for ch in remaining:
+                ver = versions.get(ch)
+                if ver is None:
+                    continue
+                blob_entry = self.blobs.get((thread_id, checkpoint_ns, ch, ver))
+                if blob_entry is None or blob_entry[0] == "empty":
+                    continue
+                blob_value_by_ch[ch] = self.serde.loads_typed(blob_entry)
+                terminated_here.add(ch)
 
             step_writes = self.writes.get((thread_id, checkpoint_ns, cp_id), {})
             for (_task_id, _idx), (tid, ch, serialized, _) in sorted(
@@ -218,6 +402,8 @@ class InMemorySaver(
                 seed_by_ch[ch] = blob_value_by_ch[ch]
                 remaining.discard(ch)
 
+            cp_id = entry[2]
+
         result: dict[str, DeltaChannelHistory] = {}
         for ch in channels:
             entry_h: DeltaChannelHistory = {
@@ -231,7 +417,9 @@ class InMemorySaver(
     async def aget_delta_channel_history(
         self, *, config: RunnableConfig, channels: Sequence[str]
     ) -> Mapping[str, DeltaChannelHistory]:
-        return self.get_delta_channel_history(config=config, channels=channels)
+        return await self._run_sync(
+            self.get_delta_channel_history, config=config, channels=channels
+        )
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the in-memory storage.
@@ -252,8 +440,11 @@ class InMemorySaver(
         if checkpoint_id := get_checkpoint_id(config):
             if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
                 checkpoint, metadata, parent_checkpoint_id = saved
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint)
+                checkpoint_: Checkpoint = _copy_stored_checkpoint(
+                    self._load_checkpoint(
+                        thread_id, checkpoint_ns, checkpoint_id, checkpoint
+                    )
+                )
                 return CheckpointTuple(
                     config=config,
                     checkpoint={
@@ -263,9 +454,9 @@ class InMemorySaver(
                         ),
                     },
                     metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
-                    ],
+                    pending_writes=self._load_writes(
+                        thread_id, checkpoint_ns, checkpoint_id
+                    ),
                     parent_config=(
                         {
                             "configurable": {
@@ -280,10 +471,13 @@ class InMemorySaver(
                 )
         else:
             if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
+                checkpoint_id = self._get_checkpoint_ids(thread_id, checkpoint_ns)[-1]
                 checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
-                checkpoint_ = self.serde.loads_typed(checkpoint)
+                checkpoint_ = _copy_stored_checkpoint(
+                    self._load_checkpoint(
+                        thread_id, checkpoint_ns, checkpoint_id, checkpoint
+                    )
+                )
                 return CheckpointTuple(
                     config={
                         "configurable": {
@@ -299,9 +493,9 @@ class InMemorySaver(
                         ),
                     },
                     metadata=self.serde.loads_typed(metadata),
-                    pending_writes=[
-                        (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
-                    ],
+                    pending_writes=self._load_writes(
+                        thread_id, checkpoint_ns, checkpoint_id
+                    ),
                     parent_config=(
                         {
                             "configurable": {
@@ -337,59 +531,88 @@ class InMemorySaver(
         Yields:
             An iterator of matching checkpoint tuples.
         """
-        thread_ids = (config["configurable"]["thread_id"],) if config else self.storage
+        if limit is not None:
+            limit = max(limit, 0)
+        # islice stops pulling once the limit is reached, so checkpoints past it
+        # are never deserialized
+        yield from islice(
+            self._iter_checkpoint_tuples(
+                config, filter=filter, before=before, limit=limit
+            ),
+            limit,
+        )
+
+    def _iter_checkpoint_tuples(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None,
+        before: RunnableConfig | None,
+        limit: int | None,
+    ) -> Iterator[CheckpointTuple]:
+        thread_ids = (
+            (config["configurable"]["thread_id"],) if config else list(self.storage)
+        )
         config_checkpoint_ns = (
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
+        filter_items = tuple(filter.items()) if filter else ()
         for thread_id in thread_ids:
-            for checkpoint_ns in self.storage[thread_id].keys():
+            for checkpoint_ns in list(self.storage[thread_id]):
                 if (
                     config_checkpoint_ns is not None
                     and checkpoint_ns != config_checkpoint_ns
                 ):
                     continue
 
-                for checkpoint_id, (
-                    checkpoint,
-                    metadata_b,
-                    parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
-                ):
-                    # filter by checkpoint ID from config
-                    if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
-                        continue
+                checkpoints = self.storage[thread_id][checkpoint_ns]
+                checkpoint_ids = self._get_checkpoint_ids(thread_id, checkpoint_ns)
+                # filter by checkpoint ID from `before` config
+                end = (
+                    bisect_left(checkpoint_ids, before_checkpoint_id)
+                    if before_checkpoint_id
+                    else len(checkpoint_ids)
+                )
+                # filter by checkpoint ID from config
+                if config_checkpoint_id:
+                    candidate_ids: Iterable[str] = (
+                        (config_checkpoint_id,)
+                        if config_checkpoint_id in checkpoints
+                        and (
+                            not before_checkpoint_id
+                            or config_checkpoint_id < before_checkpoint_id
+                        )
+                        else ()
+                    )
+                else:
+                    # without a metadata filter no more than `limit` candidates
+                    # can be yielded from this namespace
+                    start = (
+                        max(end - limit, 0) if limit is not None and not filter else 0
+                    )
+                    # copy, so concurrent puts don't disturb iteration
+                    candidate_ids = reversed(checkpoint_ids[start:end])
 
-                    # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
+                for checkpoint_id in candidate_ids:
+                    if (saved := checkpoints.get(checkpoint_id)) is None:
                         continue
+                    checkpoint, metadata_b, parent_checkpoint_id = saved
 
                     # filter by metadata
                     metadata = self.serde.loads_typed(metadata_b)
-                    if filter and not all(
+                    if filter_items and not all(
                         query_value == metadata.get(query_key)
-                        for query_key, query_value in filter.items()
+                        for query_key, query_value in filter_items
                     ):
                         continue
 
-                    # limit search results
-                    if limit is not None and limit <= 0:
-                        break
-                    elif limit is not None:
-                        limit -= 1
-
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
-
-                    checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint)
+                    checkpoint_: Checkpoint = _copy_stored_checkpoint(
+                        self._load_checkpoint(
+                            thread_id, checkpoint_ns, checkpoint_id, checkpoint
+                        )
+                    )
 
                     yield CheckpointTuple(
                         config={
@@ -419,9 +642,9 @@ class InMemorySaver(
                             if parent_checkpoint_id
                             else None
                         ),
-                        pending_writes=[
-                            (id, c, self.serde.loads_typed(v)) for id, c, v, _ in writes
-                        ],
+                        pending_writes=self._load_writes(
+                            thread_id, checkpoint_ns, checkpoint_id
+                        ),
                     )
 
     def put(
@@ -445,23 +668,15 @@ class InMemorySaver(
         Returns:
             RunnableConfig: The updated config containing the saved checkpoint's timestamp.
         """
-        c = checkpoint.copy()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
-        for k, v in new_versions.items():
-            self.blobs[(thread_id, checkpoint_ns, k, v)] = (
-                self.serde.dumps_typed(values[k]) if k in values else ("empty", b"")
-            )
-        self.storage[thread_id][checkpoint_ns].update(
-            {
-                checkpoint["id"]: (
-                    self.serde.dumps_typed(c),
-                    self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
-                    config["configurable"].get("checkpoint_id"),  # parent
-                )
-            }
+        entry = self._dump_checkpoint(
+            config, checkpoint, metadata, new_versions, self.blobs
         )
+        checkpoint_ids = self._get_checkpoint_ids(thread_id, checkpoint_ns)
+        self.storage[thread_id][checkpoint_ns][checkpoint["id"]] = entry
+        # index after storing, so readers never see an ID without its entry
+        _insort_unique(checkpoint_ids, checkpoint["id"])
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -470,6 +685,57 @@ class InMemorySaver(
             }
         }
 
+    def bulk_put(
+        self,
+        items: Iterable[
+            tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> list[RunnableConfig]:
+        """Save many checkpoints to the in-memory storage at once.
+
+        Equivalent to calling `put` for each item in order, but checkpoints are
+        grouped by thread ID and namespace first, so each group is stored with a
+        single update. Useful when warm-starting or replaying a thread.
+
+        Args:
+            items: `(config, checkpoint, metadata, new_versions)` tuples, as
+                accepted by `put`.
+
+        Returns:
+            The updated configs, one per item, in the same order.
+        """
+        blobs: dict[tuple[str, str, str, str | int | float], tuple[str, bytes]] = {}
+        batches: dict[
+            tuple[str, str],
+            dict[str, tuple[tuple[str, bytes], tuple[str, bytes], str | None]],
+        ] = {}
+        results: list[RunnableConfig] = []
+        for config, checkpoint, metadata, new_versions in items:
+            thread_id = config["configurable"]["thread_id"]
+            checkpoint_ns = config["configurable"]["checkpoint_ns"]
+            batches.setdefault((thread_id, checkpoint_ns), {})[checkpoint["id"]] = (
+                self._dump_checkpoint(config, checkpoint, metadata, new_versions, blobs)
+            )
+            results.append(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": checkpoint["id"],
+                    }
+                }
+            )
+        self.blobs.update(blobs)
+        for (thread_id, checkpoint_ns), batch in batches.items():
+            checkpoints = self.storage[thread_id][checkpoint_ns]
+            checkpoint_ids = self._get_checkpoint_ids(thread_id, checkpoint_ns)
+            new_ids = batch.keys() - checkpoints.keys()
+            checkpoints.update(batch)
+            if new_ids:
+                checkpoint_ids.extend(new_ids)
+                checkpoint_ids.sort()
+        return results
+
     def put_writes(
         self,
         config: RunnableConfig,
@@ -495,13 +761,16 @@ class InMemorySaver(
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
         checkpoint_id = config["configurable"]["checkpoint_id"]
         outer_key = (thread_id, checkpoint_ns, checkpoint_id)
-        outer_writes_ = self.writes.get(outer_key)
+        if self._thread_write_keys is not None:
+            self._thread_write_keys.add(outer_key)
+        outer_writes_ = self.writes[outer_key]
         for idx, (c, v) in enumerate(writes):
+            c = _intern_channel(c)
             inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
-            if inner_key[1] >= 0 and outer_writes_ and inner_key in outer_writes_:
+            if inner_key[1] >= 0 and inner_key in outer_writes_:
                 continue
 
-            self.writes[outer_key][inner_key] = (
+            outer_writes_[inner_key] = (
                 task_id,
                 c,
                 self.serde.dumps_typed(v),
@@ -519,12 +788,20 @@ class InMemorySaver(
         """
         if thread_id in self.storage:
             del self.storage[thread_id]
-        for k in list(self.writes.keys()):
-            if k[0] == thread_id:
-                del self.writes[k]
-        for k in list(self.blobs.keys()):
+        self._checkpoint_ids.pop(thread_id, None)
+        if self._thread_write_keys is not None and self._thread_blob_keys is not None:
+            self._thread_write_keys.delete_thread(thread_id, self.writes)
+            self._thread_blob_keys.delete_thread(thread_id, self.blobs)
+        else:
+            for k in list(self.writes.keys()):
+                if k[0] == thread_id:
+                    del self.writes[k]
+            for k in list(self.blobs.keys()):
+                if k[0] == thread_id:
+                    del self.blobs[k]
+        for k in list(self._checkpoint_cache):
             if k[0] == thread_id:
-                del self.blobs[k]
+                self._checkpoint_cache.pop(k, None)
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Asynchronous version of `get_tuple`.
@@ -538,7 +815,7 @@ class InMemorySaver(
         Returns:
             The retrieved checkpoint tuple, or None if no matching checkpoint was found.
         """
-        return self.get_tuple(config)
+        return await self._run_sync(self.get_tuple, config)
 
     async def alist(
         self,
@@ -559,8 +836,17 @@ class InMemorySaver(
         Yields:
             An asynchronous iterator of checkpoint tuples.
         """
-        for item in self.list(config, filter=filter, before=before, limit=limit):
-            yield item
+        iterator = self.list(config, filter=filter, before=before, limit=limit)
+        if not self.offload_to_thread:
+            for item in iterator:
+                yield item
+            return
+        # fetch in batches, so each thread hop is shared by several checkpoints
+        while batch := await asyncio.to_thread(
+            list, islice(iterator, _ALIST_BATCH_SIZE)
+        ):
+            for item in batch:
+                yield item
 
     async def aput(
         self,
@@ -580,7 +866,26 @@ class InMemorySaver(
         Returns:
             RunnableConfig: The updated config containing the saved checkpoint's timestamp.
         """
-        return self.put(config, checkpoint, metadata, new_versions)
+        return await self._run_sync(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def abulk_put(
+        self,
+        items: Iterable[
+            tuple[RunnableConfig, Checkpoint, CheckpointMetadata, ChannelVersions]
+        ],
+    ) -> list[RunnableConfig]:
+        """Asynchronous version of `bulk_put`.
+
+        Args:
+            items: `(config, checkpoint, metadata, new_versions)` tuples, as
+                accepted by `put`.
+
+        Returns:
+            The updated configs, one per item, in the same order.
+        """
+        return await self._run_sync(self.bulk_put, items)
 
     async def aput_writes(
         self,
@@ -603,7 +908,7 @@ class InMemorySaver(
         Returns:
             None
         """
-        return self.put_writes(config, writes, task_id, task_path)
+        return await self._run_sync(self.put_writes, config, writes, task_id, task_path)
 
     async def adelete_thread(self, thread_id: str) -> None:
         """Delete all checkpoints and writes associated with a thread ID.
@@ -614,7 +919,7 @@ class InMemorySaver(
         Returns:
             None
         """
-        return self.delete_thread(thread_id)
+        return await self._run_sync(self.delete_thread, thread_id)
 
     def get_next_version(self, current: str | None, channel: None) -> str:
         if current is None:
@@ -624,8 +929,9 @@ class InMemorySaver(
         else:
             current_v = int(current.split(".")[0])
         next_v = current_v + 1
-        next_h = random.random()
-        return f"{next_v:032}.{next_h:016}"
+        # the random suffix keeps versions from colliding across forks, hex
+        # formatting `getrandbits` is much cheaper than formatting a float
+        return f"{next_v:032}.{random.getrandbits(64):016x}"
 
 
 MemorySaver = InMemorySaver  # Kept for backwards compatibility
@@ -683,7 +989,9 @@ class PersistentDict(defaultdict):
 
     def dump(self, fileobj: Any) -> None:
         if self.format == "pickle":
-            pickle.dump(dict(self), fileobj, 2)
+            # protocol 2 round-trips bytes through `codecs.encode`; newer
+            # protocols write them natively, which is much faster and smaller
+            pickle.dump(dict(self), fileobj, pickle.HIGHEST_PROTOCOL)
         else:
             raise NotImplementedError("Unknown format: " + repr(self.format))
 
@@ -1,4 +1,7 @@
 import logging
+import pickle
+import threading
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -11,7 +14,7 @@ from langgraph.checkpoint.base import (
     create_checkpoint,
     empty_checkpoint,
 )
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.memory import InMemorySaver, PersistentDict
 from langgraph.checkpoint.serde.jsonplus import (
     JsonPlusSerializer,
     _warned_blocked_types,
@@ -151,7 +154,52 @@ class TestMemorySaver:
             search_results_5[1].config["configurable"]["checkpoint_ns"],
         } == {"", "inner"}
 
-        # TODO: test before and limit params
+    def test_list_before_and_limit(self) -> None:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+        }
+        checkpoint_ids = []
+        chkpnt = self.chkpnt_1
+        for step in range(5):
+            chkpnt = create_checkpoint(chkpnt, {}, step)
+            config = self.memory_saver.put(
+                config, chkpnt, {"step": step}, chkpnt["channel_versions"]
+            )
+            checkpoint_ids.append(chkpnt["id"])
+
+        thread_config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+        latest = self.memory_saver.get_tuple(thread_config)
+        assert latest is not None
+        assert latest.checkpoint["id"] == checkpoint_ids[-1]
+
+        # newest first
+        results = list(self.memory_saver.list(thread_config))
+        assert [r.checkpoint["id"] for r in results] == checkpoint_ids[::-1]
+
+        assert list(self.memory_saver.list(thread_config, limit=0)) == []
+
+        results = list(self.memory_saver.list(thread_config, limit=2))
+        assert [r.checkpoint["id"] for r in results] == [
+            checkpoint_ids[4],
+            checkpoint_ids[3],
+        ]
+
+        before: RunnableConfig = {
+            "configurable": {
+                "thread_id": "thread-1",
+                "checkpoint_id": checkpoint_ids[3],
+            }
+        }
+        results = list(self.memory_saver.list(thread_config, before=before, limit=2))
+        assert [r.checkpoint["id"] for r in results] == [
+            checkpoint_ids[2],
+            checkpoint_ids[1],
+        ]
+
+        results = list(
+            self.memory_saver.list(thread_config, before=before, filter={"step": 0})
+        )
+        assert [r.checkpoint["id"] for r in results] == [checkpoint_ids[0]]
 
     async def test_asearch(self) -> None:
         # set up test
@@ -207,6 +255,252 @@ class TestMemorySaver:
         assert len(search_results_4) == 0
 
 
+def test_delete_thread_only_removes_that_thread() -> None:
+    memory_saver = InMemorySaver()
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"foo": "bar"}
+    checkpoint["channel_versions"] = {"foo": 1}
+
+    configs = {}
+    for thread_id in ("thread-1", "thread-2"):
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+        }
+        configs[thread_id] = memory_saver.put(config, checkpoint, {}, {"foo": 1})
+        memory_saver.put_writes(configs[thread_id], [("foo", "baz")], "task-1")
+
+    memory_saver.delete_thread("thread-1")
+
+    assert memory_saver.get_tuple(configs["thread-1"]) is None
+    assert not any(k[0] == "thread-1" for k in memory_saver.writes)
+    assert not any(k[0] == "thread-1" for k in memory_saver.blobs)
+
+    remaining = memory_saver.get_tuple(configs["thread-2"])
+    assert remaining is not None
+    assert remaining.checkpoint["channel_values"] == {"foo": "bar"}
+    assert remaining.pending_writes == [("task-1", "foo", "baz")]
+
+
+def test_delete_thread_with_persistent_dict(tmp_path: Path) -> None:
+    def make_saver() -> InMemorySaver:
+        filenames = iter(["storage.pkl", "writes.pkl", "blobs.pkl"])
+
+        def factory(*args: Any) -> PersistentDict:
+            return PersistentDict(*args, filename=str(tmp_path / next(filenames)))
+
+        return InMemorySaver(factory=factory)  # type: ignore[arg-type]
+
+    def thread_ids(mapping: dict) -> set[str]:
+        return {k[0] for k in mapping}
+
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"foo": "bar"}
+    checkpoint["channel_versions"] = {"foo": 1}
+    configs = {}
+    with make_saver() as memory_saver:
+        for thread_id in ("thread-1", "thread-2", "thread-3"):
+            config: RunnableConfig = {
+                "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+            }
+            configs[thread_id] = memory_saver.put(config, checkpoint, {}, {"foo": 1})
+            memory_saver.put_writes(configs[thread_id], [("foo", "baz")], "task-1")
+
+        # edit the mappings directly, keeping their size
+        del memory_saver.writes[("thread-3", "", checkpoint["id"])]
+        memory_saver.writes[("thread-1", "", "other")] = {}
+
+        memory_saver.delete_thread("thread-1")
+        assert thread_ids(memory_saver.writes) == {"thread-2"}
+        assert thread_ids(memory_saver.blobs) == {"thread-2", "thread-3"}
+
+    # entries loaded from disk are deleted too
+    reloaded = make_saver()
+    for mapping in (reloaded.storage, reloaded.writes, reloaded.blobs):
+        mapping.load()  # type: ignore[attr-defined]
+    assert thread_ids(reloaded.writes) == {"thread-2"}
+
+    reloaded.delete_thread("thread-2")
+
+    assert reloaded.get_tuple(configs["thread-2"]) is None
+    assert not reloaded.writes
+    assert thread_ids(reloaded.blobs) == {"thread-3"}
+    assert reloaded.get_tuple(configs["thread-3"]) is not None
+
+
+def test_get_tuple_returns_independent_checkpoints() -> None:
+    memory_saver = InMemorySaver()
+    checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+    checkpoint["channel_versions"] = {"foo": 1}
+    checkpoint["versions_seen"] = {"node": {"foo": 1}}
+    config: RunnableConfig = {
+        "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+    }
+    config = memory_saver.put(config, checkpoint, {}, {})
+
+    first = memory_saver.get_tuple(config)
+    assert first is not None
+    first.checkpoint["channel_versions"]["foo"] = 2
+    first.checkpoint["versions_seen"]["node"].pop("foo")
+
+    second = memory_saver.get_tuple(config)
+    assert second is not None
+    assert second.checkpoint["channel_versions"] == {"foo": 1}
+    assert second.checkpoint["versions_seen"] == {"node": {"foo": 1}}
+
+
+def test_reads_do_not_allocate_pending_writes() -> None:
+    memory_saver = InMemorySaver()
+    config: RunnableConfig = {
+        "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+    }
+    config = memory_saver.put(config, empty_checkpoint(), {}, {})
+
+    assert memory_saver.get_tuple(config) is not None
+    assert memory_saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+    assert len(list(memory_saver.list(config))) == 1
+    assert len(list(memory_saver.list(None))) == 1
+    assert not memory_saver.writes
+
+
+def test_bulk_put_matches_put() -> None:
+    items = []
+    for thread_id in ("thread-1", "thread-2"):
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+        }
+        checkpoint = empty_checkpoint()
+        for step in range(3):
+            checkpoint = create_checkpoint(checkpoint, {}, step)
+            checkpoint["channel_values"] = {"foo": step}
+            checkpoint["channel_versions"] = {"foo": step + 1}
+            items.append((config, checkpoint, {"step": step}, {"foo": step + 1}))
+            config = {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": "",
+                    "checkpoint_id": checkpoint["id"],
+                }
+            }
+
+    sequential = InMemorySaver()
+    bulk = InMemorySaver()
+    expected_configs = [sequential.put(*item) for item in items]
+    assert bulk.bulk_put(items) == expected_configs
+
+    for thread_id in ("thread-1", "thread-2"):
+        thread_config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+        expected = list(sequential.list(thread_config))
+        actual = list(bulk.list(thread_config))
+        assert len(actual) == 3
+        assert [t.checkpoint for t in actual] == [t.checkpoint for t in expected]
+        assert [t.metadata for t in actual] == [t.metadata for t in expected]
+        assert [t.parent_config for t in actual] == [t.parent_config for t in expected]
+
+
+def test_checkpoint_index_follows_replaced_storage() -> None:
+    memory_saver = InMemorySaver()
+    config: RunnableConfig = {
+        "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+    }
+    checkpoint = empty_checkpoint()
+    for step in range(2):
+        checkpoint = create_checkpoint(checkpoint, {}, step)
+        config = memory_saver.put(config, checkpoint, {}, {})
+    thread_config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+    assert len(list(memory_saver.list(thread_config))) == 2
+
+    def listed_ids() -> list[str]:
+        return [
+            t.config["configurable"]["checkpoint_id"]
+            for t in memory_saver.list(thread_config)
+        ]
+
+    # swap in mappings of the same size, keeping and replacing the newest ID
+    older_id, newest_id = sorted(memory_saver.storage["thread-1"][""])
+    older, newest = memory_saver.storage["thread-1"][""].values()
+    memory_saver.storage["thread-1"][""] = {"0": older, newest_id: newest}
+    assert listed_ids() == [newest_id, "0"]
+
+    memory_saver.storage["thread-1"][""] = {older_id: older, "zzz": newest}
+    latest = memory_saver.get_tuple(thread_config)
+    assert latest is not None
+    assert latest.config["configurable"]["checkpoint_id"] == "zzz"
+    assert listed_ids() == ["zzz", older_id]
+
+
+def test_persistent_dict_round_trip(tmp_path: Path) -> None:
+    filename = str(tmp_path / "saver.pkl")
+    key = ("thread-1", "", "foo", "1")
+    with PersistentDict(filename=filename) as blobs:
+        blobs[key] = ("msgpack", b"\x00\xff" * 1024)
+
+    # written with the highest pickle protocol
+    with open(filename, "rb") as f:
+        assert f.read(2) == bytes([0x80, pickle.HIGHEST_PROTOCOL])
+
+    loaded = PersistentDict(filename=filename)
+    loaded.load()
+    assert loaded == {key: ("msgpack", b"\x00\xff" * 1024)}
+
+    # files written with the previous default protocol still load
+    legacy_filename = str(tmp_path / "legacy.pkl")
+    with open(legacy_filename, "wb") as f:
+        pickle.dump({key: ("msgpack", b"\x00\xff")}, f, 2)
+    legacy = PersistentDict(filename=legacy_filename)
+    legacy.load()
+    assert legacy == {key: ("msgpack", b"\x00\xff")}
+
+
+class ThreadRecordingSerializer(JsonPlusSerializer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.thread_ids: set[int] = set()
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        self.thread_ids.add(threading.get_ident())
+        return super().dumps_typed(obj)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        self.thread_ids.add(threading.get_ident())
+        return super().loads_typed(data)
+
+
+@pytest.mark.parametrize("offload_to_thread", [False, True])
+async def test_async_methods_offload_to_thread(offload_to_thread: bool) -> None:
+    serde = ThreadRecordingSerializer()
+    memory_saver = InMemorySaver(serde=serde, offload_to_thread=offload_to_thread)
+    config: RunnableConfig = {
+        "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+    }
+    checkpoint = empty_checkpoint()
+    # more checkpoints than `alist` fetches per thread hop
+    for step in range(40):
+        checkpoint = create_checkpoint(checkpoint, {}, step)
+        checkpoint["channel_values"] = {"foo": step}
+        checkpoint["channel_versions"] = {"foo": step + 1}
+        config = await memory_saver.aput(
+            config, checkpoint, {"step": step}, {"foo": step + 1}
+        )
+    await memory_saver.aput_writes(config, [("foo", "bar")], "task-1")
+
+    thread_config: RunnableConfig = {"configurable": {"thread_id": "thread-1"}}
+    listed = [t async for t in memory_saver.alist(thread_config)]
+    latest = await memory_saver.aget_tuple(thread_config)
+    assert latest is not None
+    assert latest.checkpoint["channel_values"] == {"foo": 39}
+    assert latest.pending_writes == [("task-1", "foo", "bar")]
+    on_loop = threading.get_ident() in serde.thread_ids
+    assert on_loop is not offload_to_thread
+
+    assert [t.metadata["step"] for t in listed] == list(range(39, -1, -1))
+    assert [t.checkpoint for t in listed] == [
+        t.checkpoint for t in memory_saver.list(thread_config)
+    ]
+
+    await memory_saver.adelete_thread("thread-1")
+    assert await memory_saver.aget_tuple(thread_config) is None
+
+
 async def test_memory_saver() -> None:
     memory_saver = InMemorySaver()
     assert isinstance(memory_saver, InMemorySaver)